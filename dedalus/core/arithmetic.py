@@ -218,7 +218,7 @@ class AddFields(Add, FutureField):
     def __init__(self, *args, **kw):
         super().__init__(*args, **kw)
         self.dist = unify_attributes(self.args, 'dist')
-        self.domain = Domain(self.dist, self._bases)
+        self.domain = Domain.get(self.dist, self._bases)
         self.tensorsig = unify_attributes(self.args, 'tensorsig')
         self.dtype = np.result_type(*[arg.dtype for arg in self.args])
 
@@ -599,7 +599,7 @@ class DotProduct(Product, FutureField):
         self.gamma_args = [indices]
         # FutureField requirements
         dist = unify_attributes((arg0, arg1), 'dist')
-        self.domain = Domain(dist, self._build_bases(arg0, arg1, **kw))
+        self.domain = Domain.get(dist, self._build_bases(arg0, arg1, **kw))
         self.tensorsig = tuple(arg0_ts_reduced + arg1_ts_reduced)
         self.dtype = np.result_type(arg0.dtype, arg1.dtype)
         # Setup ghost broadcasting
@@ -691,7 +691,7 @@ class CrossProduct(Product, FutureField):
         if arg0.tensorsig[0].dim != 3:
             raise ValueError("CrossProduct requires 3-component vector fields.")
         # FutureField requirements
-        self.domain = Domain(arg0.dist, self._build_bases(arg0, arg1, **kw))
+        self.domain = Domain.get(arg0.dist, self._build_bases(arg0, arg1, **kw))
         self.tensorsig = arg0.tensorsig
         self.dtype = np.result_type(arg0.dtype, arg1.dtype)
         # Setup ghost broadcasting
@@ -833,7 +833,7 @@ class MultiplyFields(Multiply, FutureField):
         # nonconst_ax_bases = [[b for b in bases if b is not None] for bases in ax_bases]
         # self.required_grid_axes = [len(bases) > 1 for bases in nonconst_ax_bases]
         self.dist = unify_attributes((arg0, arg1), 'dist')
-        self.domain = Domain(self.dist, self._build_bases(arg0, arg1, **kw))
+        self.domain = Domain.get(self.dist, self._build_bases(arg0, arg1, **kw))
         self.tensorsig = arg0.tensorsig + arg1.tensorsig
         self.dtype = np.result_type(arg0.dtype, arg1.dtype)
         self.gamma_args = []
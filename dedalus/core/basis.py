@@ -4,12 +4,12 @@ import numpy as np
 from scipy import sparse
 from functools import reduce
 import inspect
-from math import prod
+from math import prod, ceil
 
 from . import operators
 from ..libraries import spin_recombination
 from ..tools.array import kron, axslice, apply_matrix, permute_axis
-from ..tools.cache import CachedAttribute, CachedMethod, CachedClass
+from ..tools.cache import CachedAttribute, CachedMethod, CachedClass, CachedFunction
 from ..tools import jacobi
 from ..tools import clenshaw
 from ..tools.array import reshape_vector, axindex, axslice, interleave_matrices
@@ -65,6 +65,7 @@ class AffineCOV:
         self.problem_length = self.problem_right - self.problem_left
         self.problem_center = (self.problem_left + self.problem_right) / 2
         self.stretch = self.problem_length / self.native_length
+        self.shift = self.problem_left - self.native_left * self.stretch
 
     def problem_coord(self, native_coord):
         """Convert native coordinates to problem coordinates."""
@@ -78,8 +79,11 @@ class AffineCOV:
             else:
                 raise ValueError("String coordinate '%s' not recognized." %native_coord)
         else:
-            neutral_coord = (native_coord - self.native_left) / self.native_length
-            return self.problem_left + neutral_coord * self.problem_length
+            return self.problem_coord_array(native_coord)
+
+    def problem_coord_array(self, native_coord):
+        """Convert numeric native coordinates to problem coordinates."""
+        return native_coord * self.stretch + self.shift
 
     def native_coord(self, problem_coord):
         """Convert problem coordinates to native coordinates."""
@@ -103,9 +107,8 @@ class Basis:
     def __init__(self, coords):
         self.coords = coords
 
-    @CachedMethod
     def domain(self, dist):
-        return Domain(dist, (self,))
+        return dist.get_unit_domain(self)
 
     def clone_with(self, **new_kw):
         (_, *argnames), _, _, _, _, _, _ = inspect.getfullargspec(type(self).__init__)
@@ -139,9 +142,7 @@ class Basis:
         return self.__mul__(other)
 
     def grid_shape(self, scales):
-        shape = np.array([int(np.ceil(s*n)) for s, n in zip(scales, self.shape)])
-        shape[np.array(self.shape) == 1] = 1
-        return tuple(shape)
+        return tuple(1 if n == 1 else ceil(s*n) for s, n in zip(scales, self.shape))
 
     def global_shape(self, grid_space, scales):
         # Subclasses must implement
@@ -363,8 +364,7 @@ class IntervalBasis(Basis):
 
     def global_grid(self, dist, scale):
         """Global grid."""
-        native_grid = self._native_grid(scale)
-        problem_grid = self.COV.problem_coord(native_grid)
+        problem_grid = self.COV.problem_coord_array(self._native_grid(scale))
         return reshape_vector(problem_grid, dim=dist.dim, axis=dist.get_basis_axis(self))
 
     def local_grids(self, dist, scales):
@@ -373,10 +373,13 @@ class IntervalBasis(Basis):
 
     def local_grid(self, dist, scale):
         """Local grid."""
-        local_elements = dist.grid_layout.local_elements(self.domain(dist), scales=scale)
-        native_grid = self._native_grid(scale)[local_elements[dist.get_basis_axis(self)]]
-        problem_grid = self.COV.problem_coord(native_grid)
-        return reshape_vector(problem_grid, dim=dist.dim, axis=dist.get_basis_axis(self))
+        axis = dist.get_basis_axis(self)
+        problem_grid = self.COV.problem_coord_array(self._native_grid(scale))
+        # Only select local elements if axis is distributed in grid space
+        if not dist.grid_layout.local[axis]:
+            local_elements = dist.grid_layout.local_elements(self.domain(dist), scales=scale)
+            problem_grid = problem_grid[local_elements[axis]]
+        return reshape_vector(problem_grid, dim=dist.dim, axis=axis)
 
     def global_grid_spacing(self, dist, scale):
         """Global grid spacings."""
@@ -910,7 +913,15 @@ class FourierBase(IntervalBasis):
     def _native_grid(self, scale):
         """Native flat global grid."""
         N, = self.grid_shape((scale,))
-        return (2 * np.pi / N) * np.arange(N)
+        return self._build_native_grid(N)
+
+    @staticmethod
+    @CachedFunction
+    def _build_native_grid(N):
+        """Build read-only native grid, shared between all Fourier bases."""
+        grid = (2 * np.pi / N) * np.arange(N)
+        grid.flags.writeable = False
+        return grid
 
     @CachedMethod
     def transform_plan(self, dist, grid_size):
@@ -1944,7 +1955,7 @@ class PolarBasis(SpinBasis):
                 self.global_grid_radius(dist, scales[1]))
 
     def global_grid_radius(self, dist, scale):
-        r = self.radial_COV.problem_coord(self._native_radius_grid(scale))
+        r = self.radial_COV.problem_coord_array(self._native_radius_grid(scale))
         return reshape_vector(r, dim=dist.dim, axis=dist.get_basis_axis(self)+1)
 
     @CachedMethod
@@ -2403,13 +2414,17 @@ class DiskBasis(PolarBasis, metaclass=CachedClass):
         return NotImplemented
 
     def global_grid_radius(self, dist, scale):
-        r = self.radial_COV.problem_coord(self._native_radius_grid(scale))
+        r = self.radial_COV.problem_coord_array(self._native_radius_grid(scale))
         return reshape_vector(r, dim=dist.dim, axis=dist.get_basis_axis(self)+1)
 
     def local_grid_radius(self, dist, scale):
-        r = self.radial_COV.problem_coord(self._native_radius_grid(scale))
-        local_elements = dist.grid_layout.local_elements(self.domain(dist), scales=scale)[dist.get_basis_axis(self)+1]
-        return reshape_vector(r[local_elements], dim=dist.dim, axis=dist.get_basis_axis(self)+1)
+        radial_axis = dist.get_basis_axis(self) + 1
+        r = self.radial_COV.problem_coord_array(self._native_radius_grid(scale))
+        # Only select local elements if axis is distributed in grid space
+        if not dist.grid_layout.local[radial_axis]:
+            local_elements = dist.grid_layout.local_elements(self.domain(dist), scales=scale)[radial_axis]
+            r = r[local_elements]
+        return reshape_vector(r, dim=dist.dim, axis=radial_axis)
 
     def _native_radius_grid(self, scale):
         N = int(np.ceil(scale * self.shape[1]))
@@ -3037,9 +3052,13 @@ class SphereBasis(SpinBasis, metaclass=CachedClass):
                 self.local_grid_colatitude(dist, scales[1]))
 
     def local_grid_colatitude(self, dist, scale):
-        local_elements = dist.grid_layout.local_elements(self.domain(dist), scales=scale)[dist.get_basis_axis(self)+1]
-        theta = self._native_colatitude_grid(scale)[local_elements]
-        return reshape_vector(theta, dim=dist.dim, axis=dist.get_basis_axis(self)+1)
+        colatitude_axis = dist.get_basis_axis(self) + 1
+        theta = self._native_colatitude_grid(scale)
+        # Only select local elements if axis is distributed in grid space
+        if not dist.grid_layout.local[colatitude_axis]:
+            local_elements = dist.grid_layout.local_elements(self.domain(dist), scales=scale)[colatitude_axis]
+            theta = theta[local_elements]
+        return reshape_vector(theta, dim=dist.dim, axis=colatitude_axis)
 
     def _native_colatitude_grid(self, scale):
         N = int(np.ceil(scale * self.shape[1]))
@@ -3986,7 +4005,7 @@ class BallRadialBasis(RegularityBasis, metaclass=CachedClass):
 
     @CachedMethod
     def _radius_grid(self, scale):
-        return self.radial_COV.problem_coord(self._native_radius_grid(scale))
+        return self.radial_COV.problem_coord_array(self._native_radius_grid(scale))
 
     def _native_radius_grid(self, scale):
         N = int(np.ceil(scale * self.shape[2]))
@@ -110,6 +110,8 @@ class Distributor:
         reduced_mesh = [m for m in mesh if m > 1]
         self.comm_cart = comm.Create_cart(reduced_mesh)
         self.comm_coords = np.array(self.comm_cart.coords, dtype=int)
+        # Cache single-basis domains by basis
+        self._unit_domains = {}
         # Build layout objects
         self._build_layouts()
 
@@ -184,6 +186,11 @@ class Distributor:
 
     def remedy_scales(self, scales):
         """Remedy different scale inputs."""
+        # Shortcut scales that are already tuples, e.g. previously remedied scales
+        if type(scales) is tuple:
+            if 0 in scales:
+                raise ValueError("Scales must be nonzero.")
+            return scales
         if scales is None:
             scales = 1
         if isinstance(scales, numbers.Number):
@@ -210,6 +217,17 @@ class Distributor:
     def last_axis(self, basis):
         return self.first_axis(basis) + basis.dim - 1
 
+    def get_unit_domain(self, basis):
+        """Retrieve the domain of a single basis."""
+        try:
+            return self._unit_domains[basis]
+        except KeyError:
+            from .domain import Domain
+            # A single basis is always in canonical order
+            domain = Domain.from_bases_trusted(self, (basis,))
+            self._unit_domains[basis] = domain
+            return domain
+
     def Field(self, *args, **kw):
         """Alternate constructor for fields."""
         from .field import Field
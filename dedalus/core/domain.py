@@ -5,6 +5,7 @@ Domain class definition.
 import logging
 import numpy as np
 from collections import OrderedDict
+from weakref import WeakValueDictionary
 from math import prod
 
 from ..tools.cache import CachedMethod, CachedClass, CachedAttribute
@@ -14,6 +15,14 @@ from .coords import Coordinate, CartesianCoordinates
 logger = logging.getLogger(__name__.split('.')[-1])
 
 
+def set_basis_shape(shape, first_axis, basis, basis_shape):
+    """Set the entries of a full shape list along the axes of a basis."""
+    # Check length so a bad basis shape can't resize the list and shift other axes
+    if len(basis_shape) != basis.dim:
+        raise ValueError("Basis shape %s does not match basis dimension %i." %(basis_shape, basis.dim))
+    shape[first_axis:first_axis+basis.dim] = basis_shape
+
+
 class Domain(metaclass=CachedClass):
     """
     The direct product of a set of bases.
@@ -26,25 +35,71 @@ class Domain(metaclass=CachedClass):
         Bases comprising the direct product domain.
     """
 
+    # Cache instances by unprocessed arguments
+    _raw_instance_cache = WeakValueDictionary()
+
+    @classmethod
+    def get(cls, dist, bases):
+        """Retrieve domain, skipping argument preprocessing for repeated calls."""
+        key = (dist, tuple(bases))
+        try:
+            return cls._raw_instance_cache[key]
+        except KeyError:
+            # Bind to local variable so weakref persists until return
+            cls._raw_instance_cache[key] = domain = cls(dist, bases)
+            return domain
+
+    @classmethod
+    def from_bases_trusted(cls, dist, bases):
+        """
+        Retrieve domain from bases that are already canonical, i.e. non-None,
+        non-overlapping, and sorted by first axis, skipping argument preprocessing.
+        """
+        bases = tuple(bases)
+        # Check ordering in a single pass
+        next_axis = 0
+        for basis in bases:
+            first_axis = dist.get_basis_axis(basis)
+            if first_axis < next_axis:
+                raise ValueError("Bases are not in canonical order.")
+            next_axis = first_axis + basis.dim
+        key = cls._preprocess_cache_args(dist, bases)
+        try:
+            return cls._instance_cache[key]
+        except KeyError:
+            # Bypass metaclass call to skip preprocessing
+            cls._instance_cache[key] = domain = type.__call__(cls, *key)
+            return domain
+
     @classmethod
     def _preprocess_args(cls, dist, bases):
         # Drop None bases
         bases = [b for b in bases if b is not None]
         # Drop duplicate bases
         bases = tuple(OrderedSet(bases))
-        # Make sure coordsystems don't overlap
-        cs = [b.coordsys for b in bases]
-        if len(set(cs)) < len(cs):
-            raise ValueError("Overlapping bases specified.")
+        # Make sure bases don't overlap, using bitmasks over axes
+        first_axes = [dist.get_basis_axis(b) for b in bases]
+        mask = 0
+        for basis, first_axis in zip(bases, first_axes):
+            basis_mask = ((1 << basis.dim) - 1) << first_axis
+            if mask & basis_mask:
+                raise ValueError("Overlapping bases specified.")
+            mask |= basis_mask
         # Sort by first axis
-        key = lambda basis: dist.get_basis_axis(basis)
-        bases = tuple(sorted(bases, key=key))
+        key = lambda pair: pair[0]
+        bases = tuple(basis for first_axis, basis in sorted(zip(first_axes, bases), key=key))
         return (dist, bases), {}
 
     def __init__(self, dist, bases):
         self.dist = dist
         self.bases = bases  # Preprocessed to remove Nones and duplicates
         self.dim = sum(basis.dim for basis in self.bases)
+        # Precompute first axis of each basis and full group shape
+        self.first_axes = tuple(dist.get_basis_axis(basis) for basis in bases)
+        full_group_shape = [1] * dist.dim
+        for basis, first_axis in zip(bases, self.first_axes):
+            set_basis_shape(full_group_shape, first_axis, basis, basis.group_shape)
+        self.full_group_shape = tuple(full_group_shape)
 
     @CachedAttribute
     def volume(self):
@@ -53,16 +108,16 @@ class Domain(metaclass=CachedClass):
     @CachedAttribute
     def bases_by_axis(self):
         bases_by_axis = OrderedDict()
-        for basis in self.bases:
-            for axis in range(self.dist.get_basis_axis(basis), self.dist.get_basis_axis(basis)+basis.dim):
+        for basis, first_axis in zip(self.bases, self.first_axes):
+            for axis in range(first_axis, first_axis+basis.dim):
                 bases_by_axis[axis] = basis
         return bases_by_axis
 
     @CachedAttribute
     def full_bases(self):
         full_bases = [None for i in range(self.dist.dim)]
-        for basis in self.bases:
-            for axis in range(self.dist.get_basis_axis(basis), self.dist.get_basis_axis(basis)+basis.dim):
+        for basis, first_axis in zip(self.bases, self.first_axes):
+            for axis in range(first_axis, first_axis+basis.dim):
                 full_bases[axis] = basis
         return tuple(full_bases)
 
@@ -82,17 +137,23 @@ class Domain(metaclass=CachedClass):
     @CachedAttribute
     def dealias(self):
         dealias = [1] * self.dist.dim
-        for basis in self.bases:
+        for basis, first_axis in zip(self.bases, self.first_axes):
             for subaxis in range(basis.dim):
-                dealias[self.dist.get_basis_axis(basis)+subaxis] = basis.dealias[subaxis]
+                dealias[first_axis+subaxis] = basis.dealias[subaxis]
         return tuple(dealias)
 
     def substitute_basis(self, old_basis, new_basis):
         new_bases = list(self.bases)
         if old_basis in new_bases:
+            index = new_bases.index(old_basis)
+            # Substitution on the same axes preserves canonical ordering
+            if (new_basis is not None and new_basis.dim == old_basis.dim and
+                    self.dist.get_basis_axis(new_basis) == self.first_axes[index]):
+                new_bases[index] = new_basis
+                return Domain.from_bases_trusted(self.dist, new_bases)
             new_bases.remove(old_basis)
         new_bases.append(new_basis)
-        return Domain(self.dist, new_bases)
+        return Domain.get(self.dist, new_bases)
 
     def get_basis(self, coords):
         if isinstance(coords, int):
@@ -103,8 +164,7 @@ class Domain(metaclass=CachedClass):
 
     def get_basis_subaxis(self, coord):
         axis = self.dist.get_axis(coord)
-        for basis in self.bases:
-            basis_axis = self.dist.get_basis_axis(basis)
+        for basis, basis_axis in zip(self.bases, self.first_axes):
             if basis_axis <= axis < basis_axis + basis.dim:
                 return axis - basis_axis
 
@@ -133,8 +193,7 @@ class Domain(metaclass=CachedClass):
     def constant(self):
         """Tuple of constant flags."""
         const = np.ones(self.dist.dim, dtype=bool)
-        for basis in self.bases:
-            first_axis = self.dist.get_basis_axis(basis)
+        for basis, first_axis in zip(self.bases, self.first_axes):
             for subaxis in range(basis.dim):
                 const[first_axis+subaxis] = basis.constant[subaxis]
         return tuple(const)
@@ -147,8 +206,7 @@ class Domain(metaclass=CachedClass):
     def mode_dependence(self):
         """Tuple of dependence flags."""
         dep = np.zeros(self.dist.dim, dtype=bool)
-        for basis in self.bases:
-            first_axis = self.dist.get_basis_axis(basis)
+        for basis, first_axis in zip(self.bases, self.first_axes):
             for subaxis in range(basis.dim):
                 dep[first_axis+subaxis] = basis.subaxis_dependence[subaxis]
         return tuple(dep)
@@ -170,41 +228,32 @@ class Domain(metaclass=CachedClass):
         return self._grid_shape(scales)
 
     def global_shape(self, layout, scales):
-        shape = np.ones(self.dist.dim, dtype=int)
-        for basis in self.bases:
-            first_axis = self.dist.get_basis_axis(basis)
+        shape = [1] * self.dist.dim
+        for basis, first_axis in zip(self.bases, self.first_axes):
             basis_axes = slice(first_axis, first_axis+basis.dim)
-            shape[basis_axes] = basis.global_shape(layout.grid_space[basis_axes], scales[basis_axes])
+            set_basis_shape(shape, first_axis, basis, basis.global_shape(layout.grid_space[basis_axes], scales[basis_axes]))
         return tuple(shape)
 
     @CachedMethod
     def chunk_shape(self, layout):
         """Compute chunk shape."""
-        shape = np.ones(self.dist.dim, dtype=int)
-        for basis in self.bases:
-            first_axis = self.dist.get_basis_axis(basis)
+        shape = [1] * self.dist.dim
+        for basis, first_axis in zip(self.bases, self.first_axes):
             basis_axes = slice(first_axis, first_axis+basis.dim)
-            shape[basis_axes] = basis.chunk_shape(layout.grid_space[basis_axes])
+            set_basis_shape(shape, first_axis, basis, basis.chunk_shape(layout.grid_space[basis_axes]))
         return tuple(shape)
 
     def group_shape(self, layout):
         """Compute group shape."""
-        group_shape = np.ones(self.dist.dim, dtype=int)
-        for basis in self.bases:
-            first_axis = self.dist.get_basis_axis(basis)
-            basis_axes = slice(first_axis, first_axis+basis.dim)
-            group_shape[basis_axes] = basis.group_shape
-        group_shape[layout.grid_space] = 1
-        return group_shape
+        return tuple(1 if grid_space else group_size for group_size, grid_space in zip(self.full_group_shape, layout.grid_space))
 
     @CachedMethod
     def _grid_shape(self, scales):
         """Cached grid shape computation."""
-        shape = np.ones(self.dist.dim, dtype=int)
-        for basis in self.bases:
-            subscales = scales[basis.axis:basis.axis+basis.dim]
-            subshape = basis.grid_shape(subscales)
-            shape[basis.axis:basis.axis+basis.dim] = subshape
+        shape = [1] * self.dist.dim
+        for basis, first_axis in zip(self.bases, self.first_axes):
+            basis_axes = slice(first_axis, first_axis+basis.dim)
+            set_basis_shape(shape, first_axis, basis, basis.grid_shape(scales[basis_axes]))
         return tuple(shape)
 
     # def expand_bases(self, bases):
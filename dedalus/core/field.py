@@ -551,7 +551,7 @@ class Field(Current):
         self.tensorsig = tensorsig
         self.dtype = dtype
         # Build domain
-        self.domain = Domain(dist, bases)
+        self.domain = Domain.get(dist, bases)
         # Set initial scales and layout
         self.scales = None
         self.buffer_size = -1
@@ -619,7 +619,7 @@ class Field(Current):
                 break
         # Copy over scale change
         old_data = self.data
-        self.preset_scales(scales)
+        self.preset_scales(new_scales)
         copyto(self.data, old_data)
 
     def change_layout(self, layout):
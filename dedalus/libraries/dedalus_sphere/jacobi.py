@@ -139,9 +139,40 @@ def grid_guess(n,a,b,dtype='longdouble',quick=False):
 
     from scipy.linalg import eigvalsh_tridiagonal as eigs
 
-    Z = banded(operator('Z')(n,a,b))
+    return eigs(*jacobi_diagonals(n,a,b)).astype(dtype)
 
-    return eigs(Z.diagonal(0),Z.diagonal(1)).astype(dtype)
+def jacobi_diagonals(n,a,b):
+    """
+    Main and upper diagonals of the normalised Jacobi matrix,
+
+    Z(n,a,b) = operator('Z')(n,a,b),
+
+    built directly from the three-term recurrence coefficients.
+
+    Parameters
+    ----------
+    n: int > 0.
+    a,b: float > -1.
+
+    """
+
+    if n < 1:
+        raise ValueError('n must be positive.')
+
+    N   = np.arange(n,dtype='float64')
+    nab = 2*N+a+b
+
+    main = np.zeros(n)
+    main[1:] = (b**2-a**2)/(nab[1:]*(nab[1:]+2))
+    main[0]  = (b-a)/(a+b+2)
+
+    N, nab = N[1:n-1], nab[1:n-1]
+
+    upper = np.zeros(max(n-1,0))
+    upper[1:] = 2*np.sqrt((N+1)*(N+a+1)*(N+b+1)*(N+a+b+1)/((nab+1)*(nab+3)))/(nab+2)
+    upper[:1] = 2*np.sqrt((a+1)*(b+1)/(a+b+3))/(a+b+2)
+
+    return main, upper
 
 
 def measure(a,b,z,probability=True,log=False):
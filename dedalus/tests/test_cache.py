@@ -0,0 +1,71 @@
+"""Test caching tools."""
+
+import pytest
+from dedalus.tools.cache import CachedFunction, CachedMethod
+
+
+def test_function_call_forms():
+    """Test positional, keyword, and default-resolved calls share one result."""
+    calls = []
+    @CachedFunction
+    def f(a, b=2):
+        calls.append((a, b))
+        return [a, b]
+    result = f(1, 2)
+    assert f(1, 2) is result
+    assert f(1, b=2) is result
+    assert f(a=1, b=2) is result
+    assert f(1) is result
+    assert calls == [(1, 2)]
+
+
+def test_function_keyword_keys():
+    """Test keyword call keys do not collide with positional call keys."""
+    @CachedFunction
+    def f(*args, **kw):
+        return (args, kw)
+    # Positional argument shaped like a keyword call key
+    args = ((), (('a', 1),))
+    assert f(*args) == (args, {})
+    assert f(a=1) == ((), {'a': 1})
+
+
+def test_method_call_forms():
+    """Test cached methods share results across call forms."""
+    calls = []
+    class A:
+        @CachedMethod
+        def f(self, a, b=2):
+            calls.append((a, b))
+            return [a, b]
+    obj = A()
+    result = obj.f(1)
+    assert obj.f(1, 2) is result
+    assert obj.f(1, b=2) is result
+    assert calls == [(1, 2)]
+
+
+@pytest.mark.parametrize('held', [False, True])
+def test_method_no_args(held):
+    """Test zero-argument cached methods run once per instance."""
+    calls = []
+    class A:
+        @CachedMethod
+        def f(self):
+            """Docstring."""
+            calls.append(self)
+            return [len(calls)]
+    obj = A()
+    if held:
+        f = obj.f
+        results = [f() for i in range(3)]
+    else:
+        results = [obj.f() for i in range(3)]
+    assert all(result is results[0] for result in results)
+    assert calls == [obj]
+    assert obj.f.__name__ == 'f'
+    assert obj.f.__doc__ == "Docstring."
+    # Separate instances have separate caches
+    other = A()
+    assert other.f() is not results[0]
+    assert calls == [obj, other]
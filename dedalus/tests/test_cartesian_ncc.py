@@ -4,14 +4,14 @@
 import pytest
 import numpy as np
 import dedalus.public as d3
-from dedalus.tools.cache import CachedMethod
+from dedalus.tools.cache import CachedFunction
 
 
 def xfail_param(param, reason, run=True):
     return pytest.param(param, marks=pytest.mark.xfail(reason=reason, run=run))
 
 
-@CachedMethod
+@CachedFunction
 def build_fourier(N, bounds, dealias, dtype):
     c = d3.Coordinate('x')
     d = d3.Distributor(c, dtype=dtype)
@@ -19,7 +19,7 @@ def build_fourier(N, bounds, dealias, dtype):
     return c, d, b
 
 
-@CachedMethod
+@CachedFunction
 def build_jacobi(N, a0, b0, bounds, dealias, dtype):
     c = d3.Coordinate('x')
     d = d3.Distributor(c, dtype=dtype)
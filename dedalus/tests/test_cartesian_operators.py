@@ -4,7 +4,7 @@
 import pytest
 import numpy as np
 import dedalus.public as d3
-from dedalus.tools.cache import CachedMethod
+from dedalus.tools.cache import CachedFunction
 
 
 N_range = [16]
@@ -15,7 +15,7 @@ Ly = 2.4
 Lz = 1.9
 
 
-@CachedMethod
+@CachedFunction
 def build_FF(N, dealias, dtype):
     c = d3.CartesianCoordinates('x', 'y')
     d = d3.Distributor(c, dtype=dtype)
@@ -31,7 +31,7 @@ def build_FF(N, dealias, dtype):
     return c, d, b, r
 
 
-@CachedMethod
+@CachedFunction
 def build_FC(N, dealias, dtype):
     c = d3.CartesianCoordinates('x', 'y')
     d = d3.Distributor(c, dtype=dtype)
@@ -46,7 +46,7 @@ def build_FC(N, dealias, dtype):
     return c, d, b, r
 
 
-@CachedMethod
+@CachedFunction
 def build_CC(N, dealias, dtype):
     c = d3.CartesianCoordinates('x', 'y')
     d = d3.Distributor(c, dtype=dtype)
@@ -58,7 +58,7 @@ def build_CC(N, dealias, dtype):
     return c, d, b, r
 
 
-@CachedMethod
+@CachedFunction
 def build_FFF(N, dealias, dtype):
     c = d3.CartesianCoordinates('x', 'y', 'z')
     d = d3.Distributor(c, dtype=dtype)
@@ -76,7 +76,7 @@ def build_FFF(N, dealias, dtype):
     return c, d, b, r
 
 
-@CachedMethod
+@CachedFunction
 def build_FFC(N, dealias, dtype):
     c = d3.CartesianCoordinates('x', 'y', 'z')
     d = d3.Distributor(c, dtype=dtype)
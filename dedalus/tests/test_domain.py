@@ -0,0 +1,62 @@
+"""Test domain construction."""
+
+import pytest
+import numpy as np
+from dedalus.core import coords, distributor, basis
+from dedalus.core.domain import Domain
+
+
+def build_bases():
+    c = coords.CartesianCoordinates('x', 'y', 'z')
+    d = distributor.Distributor(c, dtype=np.float64)
+    xb = basis.RealFourier(c['x'], size=8, bounds=(0, 2*np.pi))
+    yb = basis.RealFourier(c['y'], size=8, bounds=(0, 2*np.pi))
+    zb = basis.ChebyshevT(c['z'], size=8, bounds=(0, 1))
+    return c, d, xb, yb, zb
+
+
+def test_from_bases_trusted_matches_constructor():
+    """Test trusted construction returns the cached domain for canonical bases."""
+    c, d, xb, yb, zb = build_bases()
+    domain = Domain(d, (zb, xb))
+    assert Domain.from_bases_trusted(d, (xb, zb)) is domain
+    assert Domain.from_bases_trusted(d, (xb, yb, zb)) is Domain(d, (yb, zb, xb))
+
+
+def test_from_bases_trusted_order():
+    """Test trusted construction rejects bases out of axis order."""
+    c, d, xb, yb, zb = build_bases()
+    with pytest.raises(ValueError):
+        Domain.from_bases_trusted(d, (zb, xb))
+
+
+@pytest.mark.parametrize('old', ['x', 'z'])
+def test_substitute_basis_same_axes(old):
+    """Test same-axes basis substitution matches the general path."""
+    c, d, xb, yb, zb = build_bases()
+    if old == 'x':
+        old_basis = xb
+        new_basis = basis.ComplexFourier(c['x'], size=8, bounds=(0, 2*np.pi))
+    else:
+        old_basis = zb
+        new_basis = basis.ChebyshevU(c['z'], size=8, bounds=(0, 1))
+    domain = Domain(d, (xb, yb, zb))
+    bases = [b for b in domain.bases if b is not old_basis] + [new_basis]
+    assert domain.substitute_basis(old_basis, new_basis) is Domain(d, bases)
+
+
+def test_bases_sorted_by_axis():
+    """Test non-overlapping bases are sorted by first axis."""
+    c, d, xb, yb, zb = build_bases()
+    assert Domain(d, (zb, xb)).bases == (xb, zb)
+    assert Domain(d, (zb, None, yb, xb, zb)).bases == (xb, yb, zb)
+
+
+def test_overlapping_bases():
+    """Test bases sharing axes are rejected, e.g. a ball basis and its S2 basis."""
+    c = coords.SphericalCoordinates('phi', 'theta', 'r')
+    d = distributor.Distributor(c, dtype=np.float64)
+    ball_basis = basis.BallBasis(c, (8, 4, 6), radius=1, dtype=np.float64)
+    sphere_basis = ball_basis.S2_basis()
+    with pytest.raises(ValueError):
+        Domain(d, (ball_basis, sphere_basis))
@@ -3,7 +3,7 @@
 import pytest
 import numpy as np
 import dedalus.public as d3
-from dedalus.tools.cache import CachedMethod
+from dedalus.tools.cache import CachedFunction
 
 
 N_range = [10]
@@ -12,7 +12,7 @@ dealias_range = [1]
 dtype_range = [np.float64, np.complex128]
 
 
-@CachedMethod
+@CachedFunction
 def build_fourier(N, bounds, dealias, dtype):
     c = d3.Coordinate('x')
     d = d3.Distributor(c, dtype=dtype)
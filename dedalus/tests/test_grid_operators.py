@@ -3,7 +3,7 @@
 import pytest
 import numpy as np
 import dedalus.public as d3
-from dedalus.tools.cache import CachedMethod
+from dedalus.tools.cache import CachedFunction
 
 
 N_range = [16]
@@ -12,7 +12,7 @@ dtype_range = [np.float64, np.complex128]
 ufuncs = d3.UnaryGridFunction.supported.values()
 
 
-@CachedMethod
+@CachedFunction
 def build_ball(N, dealias, dtype, radius=1):
     c = d3.SphericalCoordinates('phi', 'theta', 'r')
     d = d3.Distributor(c, dtype=dtype)
@@ -22,7 +22,7 @@ def build_ball(N, dealias, dtype, radius=1):
     return c, d, b, phi, theta, r, x, y, z
 
 
-@CachedMethod
+@CachedFunction
 def build_shell(N, dealias, dtype, radii=(0.5,1)):
     c = d3.SphericalCoordinates('phi', 'theta', 'r')
     d = d3.Distributor(c, dtype=dtype)
@@ -0,0 +1,25 @@
+"""Test closed-form Jacobi matrix diagonals."""
+
+import pytest
+import numpy as np
+from dedalus.libraries.dedalus_sphere import jacobi
+
+
+n_range = [1, 2, 3, 5, 16, 64]
+ab_range = [(-1/2, -1/2), (-1/2, 1/2), (1/2, -1/2), (0, 0), (1/2, 1), (2, 3/2)]
+
+
+@pytest.mark.parametrize('n', n_range)
+@pytest.mark.parametrize('a, b', ab_range)
+def test_jacobi_diagonals(n, a, b):
+    """Test closed-form Jacobi matrix diagonals against operator('Z')."""
+    Z = jacobi.banded(jacobi.operator('Z')(n, a, b))
+    main, upper = jacobi.jacobi_diagonals(n, a, b)
+    assert np.allclose(main, Z.diagonal(0))
+    assert np.allclose(upper, Z.diagonal(1))
+
+
+def test_jacobi_diagonals_empty():
+    """Test that the Jacobi matrix diagonals require n > 0."""
+    with pytest.raises(ValueError):
+        jacobi.jacobi_diagonals(0, 0, 0)
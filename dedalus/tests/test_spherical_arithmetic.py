@@ -2,7 +2,7 @@
 import pytest
 import numpy as np
 from dedalus.core import coords, distributor, basis, field, operators, arithmetic
-from dedalus.tools.cache import CachedMethod
+from dedalus.tools.cache import CachedFunction
 from mpi4py import MPI
 
 comm = MPI.COMM_WORLD
@@ -14,7 +14,7 @@ radius_range = [1.5]
 dealias_range = [1, 3/2]
 
 radius_ball = 1.5
-@CachedMethod
+@CachedFunction
 def build_ball(Nphi, Ntheta, Nr, dealias, dtype):
     c = coords.SphericalCoordinates('phi', 'theta', 'r')
     d = distributor.Distributor((c,))
@@ -24,7 +24,7 @@ def build_ball(Nphi, Ntheta, Nr, dealias, dtype):
     return c, d, b, phi, theta, r, x, y, z
 
 radii_shell = (0.5, 3)
-@CachedMethod
+@CachedFunction
 def build_shell(Nphi, Ntheta, Nr, dealias, dtype):
     c = coords.SphericalCoordinates('phi', 'theta', 'r')
     d = distributor.Distributor((c,))
@@ -2,7 +2,7 @@
 import pytest
 import numpy as np
 from dedalus.core import coords, distributor, basis, field, operators, arithmetic
-from dedalus.tools.cache import CachedMethod
+from dedalus.tools.cache import CachedFunction
 from mpi4py import MPI
 
 
@@ -17,7 +17,7 @@ dealias_range = [1, 1.5]
 
 
 radius_ball = 1.5
-@CachedMethod
+@CachedFunction
 def build_ball(Nphi, Ntheta, Nr, dtype, dealias, mesh=None):
     c = coords.SphericalCoordinates('phi', 'theta', 'r')
     d = distributor.Distributor((c,), mesh=mesh)
@@ -28,7 +28,7 @@ def build_ball(Nphi, Ntheta, Nr, dtype, dealias, mesh=None):
 
 
 radii_shell = (1, 2)
-@CachedMethod
+@CachedFunction
 def build_shell(Nphi, Ntheta, Nr, dtype, dealias, mesh=None):
     c = coords.SphericalCoordinates('phi', 'theta', 'r')
     d = distributor.Distributor((c,), mesh=mesh)
@@ -8,7 +8,14 @@ import inspect
 import types
 from weakref import WeakValueDictionary
 from collections import OrderedDict
-from functools import partial
+from functools import partial, wraps
+
+
+# Sentinel distinguishing keyword call keys from positional call keys
+_KW_MARKER = object()
+
+# Sentinel for zero-argument methods that have not been evaluated
+_EMPTY = object()
 
 
 class CachedAttribute:
@@ -56,8 +63,9 @@ class CachedFunction:
         self.cache = OrderedDict()
         self.max_size = max_size
         # Retrieve arg names and default kw
-        argnames, _, _, defaults, _, _, _ = inspect.getfullargspec(function)
+        argnames, varargs, varkw, defaults, kwonlyargs, _, _ = inspect.getfullargspec(function)
         self.argnames = argnames
+        self.no_varargs = not (varargs or varkw or kwonlyargs)
         if defaults:
             self.defaults = dict(zip(reversed(argnames), reversed(defaults)))
         else:
@@ -65,7 +73,11 @@ class CachedFunction:
 
     def __call__(self, *args, **kw):
         # First try direct call signature
-        direct_call = (args, tuple(kw.items()))
+        # (positional calls are keyed by args alone to avoid building nested keys)
+        if kw:
+            direct_call = (_KW_MARKER, args, tuple(kw.items()))
+        else:
+            direct_call = args
         try:
             return self.cache[direct_call]
         except KeyError:
@@ -97,6 +109,17 @@ class CachedMethod(CachedFunction):
         # Return self when accessed from class
         if instance is None:
             return self
+        # Zero-argument methods: compute once and then return the stored result
+        if len(self.argnames) == 1 and self.no_varargs:
+            result = _EMPTY
+            @wraps(self.function)
+            def cached_method():
+                nonlocal result
+                if result is _EMPTY:
+                    result = self.function(instance)
+                return result
+            setattr(instance, self.__name__, cached_method)
+            return cached_method
         # Build new cached method and bind to instance
         # (allows the cache to be deallocated with the instance)
         new_cached_method = CachedMethod(self.function, self.max_size)
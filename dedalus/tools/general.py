@@ -59,6 +59,10 @@ def oscillate(iterable, max_passes=np.inf):
             return
 
 
+# Sentinel for missing attributes
+_MISSING = object()
+
+
 def unify(objects):
     """
     Check if all objects in a collection are equal.
@@ -68,20 +72,19 @@ def unify(objects):
         if i == 0:
             OBJECT = object
         else:
-            if object != OBJECT:
+            # Check identity first to skip equality tests for shared objects
+            if object is not OBJECT and object != OBJECT:
                 raise ValueError("Objects are not all equal.")
     return OBJECT
 
 
 def unify_attributes(objects, attr, require=True):
     """Unify object attributes."""
-    attrs = []
-    for object in objects:
-        try:
-            attrs.append(getattr(object, attr))
-        except AttributeError:
-            if require:
-                raise
+    if require:
+        attrs = (getattr(object, attr) for object in objects)
+    else:
+        attrs = (getattr(object, attr, _MISSING) for object in objects)
+        attrs = (value for value in attrs if value is not _MISSING)
     return unify(attrs)
 
 
@@ -211,16 +211,28 @@ def mass(a,b):
 import numpy as np
 from scipy import sparse
 from ..libraries.dedalus_sphere import jacobi
+from .cache import CachedFunction
 
 output_dtype = np.float64
 
-def build_grid(N, a, b):
+@CachedFunction
+def build_quadrature(N, a, b):
+    """Gauss-Jacobi grid and weights, cached and returned as read-only arrays."""
     grid, weights = jacobi.quadrature(N, a, b)
-    return grid.astype(output_dtype)
+    grid = grid.astype(output_dtype)
+    weights = weights.astype(output_dtype)
+    # Protect cached arrays from in-place modification
+    grid.flags.writeable = False
+    weights.flags.writeable = False
+    return grid, weights
+
+def build_grid(N, a, b):
+    grid, weights = build_quadrature(N, a, b)
+    return grid
 
 def build_weights(N, a, b):
-    grid, weights = jacobi.quadrature(N, a, b)
-    return weights.astype(output_dtype)
+    grid, weights = build_quadrature(N, a, b)
+    return weights
 
 def build_polynomials(M, a, b, grid):
     poly = jacobi.polynomials(M, a, b, grid)
@@ -58,8 +58,10 @@ lift = lambda A: d3.Lift(A, disk, -1)
 # Background librating flow
 u0_real = dist.VectorField(coords, bases=disk)
 u0_imag = dist.VectorField(coords, bases=disk)
-u0_real['g'][0] = Ro * np.real(jv(1, (1-1j)*r/np.sqrt(2*Ekman)) / jv(1, (1-1j)/np.sqrt(2*Ekman)))
-u0_imag['g'][0] = Ro * np.imag(jv(1, (1-1j)*r/np.sqrt(2*Ekman)) / jv(1, (1-1j)/np.sqrt(2*Ekman)))
+kappa = (1-1j) / np.sqrt(2*Ekman)
+u0_complex = Ro * jv(1, kappa*r) / jv(1, kappa)
+u0_real['g'][0] = u0_complex.real
+u0_imag['g'][0] = u0_complex.imag
 t = dist.Field()
 u0 = np.cos(t) * u0_real - np.sin(t) * u0_imag
 